@@ -0,0 +1,60 @@
+# bench_import.py
+#
+# Cold-start benchmark for the CLI. Each sample runs in a fresh interpreter so
+# nothing is cached in sys.modules. Run `python3 bench_import.py` and compare
+# the numbers against the previous run to catch import-time regressions.
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Modules that must not be loaded just by importing the CLI
+HEAVY_MODULES = ['pandas', 'pymongo', 'bson', 'requests', 'dotenv', 'openpyxl']
+
+IMPORT_CHECK = (
+    "import sys, time; start = time.perf_counter(); import main; "
+    "elapsed = time.perf_counter() - start; "
+    f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]; "
+    "print(elapsed); print(','.join(loaded))"
+)
+
+def measure_import():
+    """Return (seconds to import main, heavy modules loaded) in a fresh interpreter."""
+    result = subprocess.run([sys.executable, '-c', IMPORT_CHECK], cwd=ROOT, capture_output=True, text=True, check=True)
+    elapsed, loaded = result.stdout.splitlines()
+    return float(elapsed), [m for m in loaded.split(',') if m]
+
+def measure_help():
+    """Return the wall-clock seconds of `main.py --help`, interpreter startup included."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(ROOT, 'main.py'), '--help'], cwd=ROOT, capture_output=True, check=True)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure CLI cold-start time')
+    parser.add_argument('--runs', type=int, default=10, help='Number of fresh interpreters per measurement (default: 10)')
+    parser.add_argument('--max-ms', type=float, help='Fail if the median `import main` time exceeds this many milliseconds')
+    args = parser.parse_args()
+
+    import_times = []
+    for _ in range(args.runs):
+        elapsed, loaded = measure_import()
+        if loaded:
+            sys.exit(f"Importing main loaded heavy modules: {', '.join(loaded)}")
+        import_times.append(elapsed)
+    help_times = [measure_help() for _ in range(args.runs)]
+
+    import_ms = statistics.median(import_times) * 1000
+    help_ms = statistics.median(help_times) * 1000
+    print(f"import main:      median {import_ms:.1f} ms, min {min(import_times) * 1000:.1f} ms ({args.runs} runs)")
+    print(f"main.py --help:   median {help_ms:.1f} ms, min {min(help_times) * 1000:.1f} ms ({args.runs} runs)")
+
+    if args.max_ms is not None and import_ms > args.max_ms:
+        sys.exit(f"import main took {import_ms:.1f} ms, above the {args.max_ms:.1f} ms budget")
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,7 @@
-import requests
 import sqlite3
 import json
 import time
 import argparse
-import pandas as pd
 import re  # For regular expression matching
 
 ## How to use
@@ -113,6 +111,8 @@ def setup_db():
 # Fetch the datasets
 def fetch_datasets(ip, params):
     """Fetch datasets from the API with the given parameters."""
+    import requests  # Imported lazily so the export commands start fast
+
     url = base_url.format(IP=ip)  # Update the base URL with the current IP
     response = requests.get(url, params=params)
     if response.status_code == 200:
@@ -307,6 +307,8 @@ def export_to_json(target_file):
 
 def export_to_excel(target_file, row_limit=50000):
     """Export data from SQLite to Excel. If the file is too large, split it into multiple files."""
+    import pandas as pd  # Imported lazily so the other commands start fast
+
     conn = sqlite3.connect('datahub_metadata.db')
     cursor = conn.cursor()
 
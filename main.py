@@ -1,81 +1,189 @@
 # main.py
+#
+# Unified command line entry point. Heavy modules (pandas, pymongo, requests)
+# are imported inside the commands that need them, and no MongoDB client is
+# created until a command starts working on a database, so `--help` and the
+# DataHub export commands start without touching the network.
+import argparse
+import importlib.util
 import os
-from dotenv import load_dotenv
-from scan import scan_mongo_database
-from profiling import profile_mongo_database
-from classification import detect_pii_fields, sample_data_and_detect_pii
-import pandas as pd
 from datetime import datetime
-from pymongo import MongoClient
 
-# Load environment variables from .env file
-load_dotenv()
+APP_NAME = "MongoPIIDetector"
+OUTPUT_DIR = '/result'
+DATAHUB_MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datahub-integration', 'main.py')
 
-# Retrieve all MongoDB connection strings from environment variables
-mongo_uris = [os.getenv(f"MONGO_URI_{i}") for i in range(1, 201)]  # This will collect MONGO_URI_1 to MONGO_URI_200
 
-# Initialize dictionaries to store results
-all_profiling_data = {}
-all_pii_data = {}
+def get_mongo_uris():
+    """Retrieve all MongoDB connection strings (MONGO_URI_1 to MONGO_URI_200) from the environment."""
+    from dotenv import load_dotenv
 
-# Iterate through each MongoDB connection string
-for mongo_uri in mongo_uris:
-    if not mongo_uri:
-        continue  # Skip if no connection string is provided
-    
-    # Create a MongoDB client for this connection string
-    client = MongoClient(mongo_uri)
-    
-    # Specify the database name (use the first database in the URI for this example)
-    db_name = mongo_uri.split('/')[1]  # This extracts the database name from the URI
+    # Load environment variables from .env file
+    load_dotenv()
 
-    # Scan the MongoDB database to get the collection names
-    collections = scan_mongo_database(db_name)
+    mongo_uris = [os.getenv(f"MONGO_URI_{i}") for i in range(1, 201)]
+    return [mongo_uri for mongo_uri in mongo_uris if mongo_uri]  # Skip if no connection string is provided
 
-    # Profile the collections in the MongoDB database
-    profiling_data = profile_mongo_database(client, db_name, collections)
+def iter_databases():
+    """Yield a (client, db_name) pair for each configured connection string, connecting lazily."""
+    from pymongo import MongoClient
+
+    for mongo_uri in get_mongo_uris():
+        # Create a MongoDB client for this connection string
+        client = MongoClient(mongo_uri)
+
+        # Specify the database name (use the first database in the URI for this example)
+        db_name = mongo_uri.split('/')[1]  # This extracts the database name from the URI
+
+        try:
+            yield client, db_name
+        finally:
+            client.close()
+
+def classify_mongo_database(client, db_name, collections):
+    """
+    Classify the PII data (fields and sample data) of the given collections.
+    :return: A list of PII results for each collection.
+    """
+    from classification import detect_pii_fields, sample_data_and_detect_pii
 
-    # Classify the PII data (fields and sample data)
     pii_data = []
     for collection_name in collections:
         collection_obj = client[db_name][collection_name]  # Get the collection object
-        
+
         # Get the fields in the collection
         sample_document = collection_obj.find_one()
         fields = list(sample_document.keys()) if sample_document else ['No documents']
-        
+
         # Classify PII fields based on field names
         pii_fields = detect_pii_fields(fields)
-        
+
         # Classify PII data based on sampled data from the collection
         pii_sample_data = sample_data_and_detect_pii(collection_obj)
-        
+
         # Append the PII results
         pii_data.append({
-            'Collection': collection_name, 
-            'PII Fields': pii_fields, 
+            'Collection': collection_name,
+            'PII Fields': pii_fields,
             'Sample PII Data': pii_sample_data
         })
-    
-    # Store the profiling and PII data for each database
-    all_profiling_data[db_name] = pd.DataFrame(profiling_data)
-    all_pii_data[db_name] = pd.DataFrame(pii_data)
-
-# Get the current timestamp and format it
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-# Set the app name and create the filename with timestamp
-app_name = "MongoPIIDetector"
-output_dir = '/result'
-os.makedirs(output_dir, exist_ok=True)  # Create the directory if it doesn't exist
-output_file = os.path.join(output_dir, f"{app_name}_{timestamp}.xlsx")
-
-# Save all profiling and PII data to separate sheets in an Excel file
-with pd.ExcelWriter(output_file) as writer:
-    for db_name, profiling_df in all_profiling_data.items():
-        profiling_df.to_excel(writer, sheet_name=f'{db_name}_Profiling', index=False)
-    
-    for db_name, pii_df in all_pii_data.items():
-        pii_df.to_excel(writer, sheet_name=f'{db_name}_PII', index=False)
-
-print(f"Scan, profiling, and PII detection results saved to {output_file}")
+    return pii_data
+
+def save_results(sheets, output_dir=OUTPUT_DIR):
+    """
+    Save the results to separate sheets in a timestamped Excel file.
+    :param sheets: A dict mapping sheet names to lists of row dicts.
+    :return: The path of the written file.
+    """
+    import pandas as pd
+
+    # Get the current timestamp and format it
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    os.makedirs(output_dir, exist_ok=True)  # Create the directory if it doesn't exist
+    output_file = os.path.join(output_dir, f"{APP_NAME}_{timestamp}.xlsx")
+
+    with pd.ExcelWriter(output_file) as writer:
+        for sheet_name, rows in sheets.items():
+            pd.DataFrame(rows).to_excel(writer, sheet_name=sheet_name, index=False)
+
+    return output_file
+
+def run_mongo(args, profile=True, classify=True):
+    """Scan every configured database, then profile and/or classify its collections."""
+    from scan import scan_mongo_database
+
+    all_profiling_data = {}
+    all_pii_data = {}
+
+    for client, db_name in iter_databases():
+        # Scan the MongoDB database to get the collection names
+        collections = scan_mongo_database(db_name, client)
+
+        if profile:
+            from profiling import profile_mongo_database
+
+            # Profile the collections in the MongoDB database
+            all_profiling_data[f'{db_name}_Profiling'] = profile_mongo_database(client, db_name, collections)
+
+        if classify:
+            all_pii_data[f'{db_name}_PII'] = classify_mongo_database(client, db_name, collections)
+
+    output_file = save_results({**all_profiling_data, **all_pii_data}, args.output_dir)
+    print(f"Results saved to {output_file}")
+
+def cmd_all(args):
+    run_mongo(args, profile=True, classify=True)
+
+def cmd_scan(args):
+    from scan import scan_mongo_database
+
+    for client, db_name in iter_databases():
+        for collection_name in scan_mongo_database(db_name, client):
+            print(f"{db_name}\t{collection_name}")
+
+def cmd_profile(args):
+    run_mongo(args, profile=True, classify=False)
+
+def cmd_classify(args):
+    run_mongo(args, profile=False, classify=True)
+
+def load_datahub():
+    """Load datahub-integration/main.py (not an importable package name) on demand."""
+    spec = importlib.util.spec_from_file_location('datahub_integration', DATAHUB_MAIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def cmd_datahub_scan(args):
+    datahub = load_datahub()
+    for ip in args.ip or datahub.IP:
+        print(f"Scanning data from {ip} and saving to SQLite with {args.count} items per page...")
+        datahub.fetch_all_datasets(ip, max_limit=10000, count=args.count, unique=args.unique)
+        print(f"Scan complete for {ip}.")
+
+def cmd_export(args):
+    datahub = load_datahub()
+    if args.format == 'json':
+        print(f"Exporting data to JSON at {args.file}...")
+        datahub.export_to_json(args.file)
+    else:
+        print(f"Exporting data to Excel at {args.file}...")
+        datahub.export_to_excel(args.file)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='MongoDB metadata scanning, profiling and PII classification')
+    parser.set_defaults(func=cmd_all, output_dir=OUTPUT_DIR)
+    subparsers = parser.add_subparsers(title='commands', metavar='command')
+
+    output_parser = argparse.ArgumentParser(add_help=False)
+    output_parser.add_argument('--output-dir', default=OUTPUT_DIR, help=f'Directory for the Excel report (default: {OUTPUT_DIR})')
+
+    scan_parser = subparsers.add_parser('scan', help='List the collections of every configured database')
+    scan_parser.set_defaults(func=cmd_scan)
+
+    profile_parser = subparsers.add_parser('profile', parents=[output_parser], help='Profile collections and save an Excel report')
+    profile_parser.set_defaults(func=cmd_profile)
+
+    classify_parser = subparsers.add_parser('classify', parents=[output_parser], help='Detect PII in collections and save an Excel report')
+    classify_parser.set_defaults(func=cmd_classify)
+
+    datahub_parser = subparsers.add_parser('datahub-scan', help='Scan DataHub datasets and save to SQLite')
+    datahub_parser.add_argument('--ip', action='append', help='DataHub host to scan (repeatable, default: the configured IP list)')
+    datahub_parser.add_argument('--count', type=int, default=1000, help='Number of items per page (default: 1000)')
+    datahub_parser.add_argument('--unique', action='store_true', default=False, help='Ensure uniqueness by db_name, db_type, and column_name (default: False)')
+    datahub_parser.set_defaults(func=cmd_datahub_scan)
+
+    export_parser = subparsers.add_parser('export', help='Export the scanned DataHub metadata from SQLite')
+    export_parser.add_argument('format', choices=['json', 'excel'], help='Export data to json or excel')
+    export_parser.add_argument('--file', required=True, help='Target file for exporting')
+    export_parser.set_defaults(func=cmd_export)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
@@ -1,27 +1,36 @@
 # scan.py
 import os
-from pymongo import MongoClient
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
-# Get MongoDB URI from environment variable
-mongo_uri = os.getenv("MONGO_URI")
+def get_default_client():
+    """
+    Create a MongoClient from the MONGO_URI environment variable.
+    Nothing is loaded or connected until this is called.
+    :return: A MongoClient object.
+    """
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+
+    # Load environment variables from .env file
+    load_dotenv()
 
-# Connect to MongoDB using the connection string from the .env file
-client = MongoClient(mongo_uri)
+    # Connect to MongoDB using the connection string from the .env file
+    return MongoClient(os.getenv("MONGO_URI"))
 
-def scan_mongo_database(db_name):
+def scan_mongo_database(db_name, client=None):
     """
     Scan the MongoDB database and get collections.
     :param db_name: The name of the MongoDB database to scan.
+    :param client: The MongoClient object to use (defaults to a client for MONGO_URI).
     :return: A list of collections in the database.
     """
+    if client is None:
+        client = get_default_client()
+
     # Connect to the database
     db = client[db_name]
-    
+
     # List all collections in the specified database
     collections = db.list_collection_names()
-    
+
     return collections